@@ -4,11 +4,270 @@ Excel Parser for Bookem Heatmap Data
 Parses Excel files and converts them to JSON/TypeScript format for the heatmap application.
 """
 
-import pandas as pd
-import json
+from __future__ import annotations
+
+import numpy as np
+import orjson
 import sys
+from datetime import date, datetime
+from functools import lru_cache
+from math import isfinite, isnan
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, BinaryIO, Callable, List, Dict, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Column name patterns per data type, in priority order
+_PATTERNS = {
+    'books': {
+        'lat': ('lat', 'latitude', 'y', 'coord_y'),
+        'lng': ('lng', 'lon', 'long', 'longitude', 'x', 'coord_x'),
+        'count': ('count', 'books', 'book_count', 'quantity', 'num'),
+    },
+    'volunteers': {
+        'id': ('id', 'volunteer_id', 'vol_id'),
+        'lat': ('lat', 'latitude', 'y'),
+        'lng': ('lng', 'lon', 'long', 'longitude', 'x'),
+        'name': ('name', 'volunteer_name', 'vol_name', 'full_name'),
+        'books': ('books', 'book_count', 'books_distributed'),
+    },
+    'schools': {
+        'id': ('id', 'school_id'),
+        'lat': ('lat', 'latitude', 'y'),
+        'lng': ('lng', 'lon', 'long', 'longitude', 'x'),
+        'name': ('name', 'school_name', 'school'),
+        'students': ('students', 'student_count', 'num_students'),
+    },
+}
+
+# Workbooks smaller than this are read with python-calamine directly and
+# parsed from plain row lists; pandas only pays off on larger sheets
+_SMALL_WORKBOOK_BYTES = 1024 * 1024
+
+
+def _numeric_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Coerce a column to float64, turning unparseable values into NaN."""
+    import pandas as pd
+    
+    return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _open_workbook(file_path: Path) -> pd.ExcelFile:
+    """Open a workbook with the calamine reader, falling back to pandas' default engine."""
+    import pandas as pd
+    
+    try:
+        return pd.ExcelFile(file_path, engine='calamine')
+    except (ImportError, ValueError):
+        # python-calamine is not installed or pandas predates the engine
+        return pd.ExcelFile(file_path)
+    except Exception:
+        if file_path.suffix.lower() != '.xls':
+            raise
+        return pd.ExcelFile(file_path)
+
+
+def _skipped_rows_message(label: str, skipped: int, first: List[Any]) -> str:
+    """Summarize the rejected rows of a sheet in a single warning."""
+    return f"Warning: Skipped {skipped} {label} rows with invalid values (first: {first})"
+
+
+def _masked_rows_message(df: pd.DataFrame, mask: np.ndarray, label: str) -> str:
+    """Summarize the rows rejected by a validity mask in a single warning."""
+    bad = df.index[~mask]
+    return _skipped_rows_message(label, len(bad), bad[:5].tolist())
+
+
+def _book_frame(df: pd.DataFrame,
+                lat_col: str = 'lat',
+                lng_col: str = 'lng',
+                count_col: str = 'count',
+                log: Callable[[str], None] = print) -> pd.DataFrame:
+    """Build a typed lat/lng/count DataFrame holding only the valid book rows."""
+    import pandas as pd
+    
+    missing = [col for col in (lat_col, lng_col, count_col) if col not in df.columns]
+    if missing:
+        log(f"Warning: Skipping book data, missing columns: {missing}")
+        return pd.DataFrame({'lat': np.empty(0), 'lng': np.empty(0),
+                             'count': np.empty(0, dtype=np.int64)})
+    
+    # Select and rename the mapped columns in one step
+    sheet = df[[lat_col, lng_col, count_col]].set_axis(['lat', 'lng', 'count'], axis=1)
+    lat = _numeric_column(sheet, 'lat')
+    lng = _numeric_column(sheet, 'lng')
+    count = _numeric_column(sheet, 'count')
+    
+    mask = ~(np.isnan(lat) | np.isnan(lng)) & np.isfinite(count)
+    if not mask.all():
+        log(_masked_rows_message(df, mask, 'book'))
+    
+    return pd.DataFrame({
+        'lat': lat[mask],
+        'lng': lng[mask],
+        'count': count[mask].astype(np.int64)
+    }, copy=False)
+
+
+def _place_frame(df: pd.DataFrame, kind: str, label: str,
+                 id_col: str, lat_col: str, lng_col: str, name_col: str,
+                 value_key: str, value_col: str,
+                 log: Callable[[str], None] = print) -> pd.DataFrame:
+    """Build a typed id/lat/lng/name/<value_key> DataFrame of valid volunteer or school rows."""
+    import pandas as pd
+    
+    missing = [col for col in (lat_col, lng_col, name_col, value_col) if col not in df.columns]
+    if missing:
+        log(f"Warning: Skipping {kind}, missing columns: {missing}")
+        return pd.DataFrame({'id': np.empty(0, dtype=np.int64), 'lat': np.empty(0),
+                             'lng': np.empty(0), 'name': np.empty(0, dtype=object),
+                             value_key: np.empty(0, dtype=np.int64)})
+    
+    # Select and rename the mapped columns in one step
+    source = [lat_col, lng_col, name_col, value_col]
+    target = ['lat', 'lng', 'name', 'value']
+    if id_col in df.columns:
+        source.append(id_col)
+        target.append('id')
+    sheet = df[source].set_axis(target, axis=1)
+    
+    if 'id' in sheet.columns:
+        ids = _numeric_column(sheet, 'id')
+    else:
+        ids = np.arange(1, len(sheet) + 1, dtype=np.float64)
+    lat = _numeric_column(sheet, 'lat')
+    lng = _numeric_column(sheet, 'lng')
+    values = _numeric_column(sheet, 'value')
+    names = sheet['name'].to_numpy(dtype=object).astype(str)
+    
+    mask = np.isfinite(ids) & ~(np.isnan(lat) | np.isnan(lng)) & np.isfinite(values)
+    if not mask.all():
+        log(_masked_rows_message(df, mask, label))
+    
+    return pd.DataFrame({
+        'id': ids[mask].astype(np.int64),
+        'lat': lat[mask],
+        'lng': lng[mask],
+        'name': names[mask].astype(object),
+        value_key: values[mask].astype(np.int64)
+    }, copy=False)
+
+
+def _cell_float(value: Any) -> float:
+    """Convert a calamine cell to float, returning NaN for non-numeric cells."""
+    if isinstance(value, (float, int)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return float(value)
+        except ValueError:
+            return float('nan')
+    # Empty cells, dates and times
+    return float('nan')
+
+
+def _column_text(cells: List[Any]) -> List[str]:
+    """Convert a calamine column to text the way the pandas path renders it."""
+    # pandas reads empty cells as NaN, whole-number floats as ints and dates
+    # as timestamps, then picks one dtype for the whole column
+    values = []
+    for cell in cells:
+        if cell == '':
+            cell = None
+        elif isinstance(cell, float) and cell.is_integer():
+            cell = int(cell)
+        elif isinstance(cell, date) and not isinstance(cell, datetime):
+            cell = datetime(cell.year, cell.month, cell.day)
+        values.append(cell)
+    present = [v for v in values if v is not None]
+    has_blank = len(present) < len(values)
+    if not present:
+        return ['nan'] * len(values)
+    if all(isinstance(v, datetime) for v in present):
+        return ['NaT' if v is None else str(v) for v in values]
+    if all(isinstance(v, (int, float)) for v in present):
+        bools = any(isinstance(v, bool) for v in present)
+        floats = any(isinstance(v, float) for v in present)
+        if has_blank or (floats and not bools):
+            return ['nan' if v is None else str(float(v)) for v in values]
+    return ['nan' if v is None else str(v) for v in values]
+
+
+def _book_rows(header: List[Any], body: List[List[Any]],
+               lat_col: str = 'lat',
+               lng_col: str = 'lng',
+               count_col: str = 'count',
+               log: Callable[[str], None] = print) -> List[Dict[str, Any]]:
+    """Parse book records straight from a sheet's header and row lists."""
+    missing = [col for col in (lat_col, lng_col, count_col) if col not in header]
+    if missing:
+        log(f"Warning: Skipping book data, missing columns: {missing}")
+        return []
+    
+    lat_idx, lng_idx, count_idx = (header.index(col) for col in (lat_col, lng_col, count_col))
+    
+    book_data = []
+    bad_rows = []
+    for idx, row in enumerate(body):
+        lat = _cell_float(row[lat_idx])
+        lng = _cell_float(row[lng_idx])
+        count = _cell_float(row[count_idx])
+        if isnan(lat) or isnan(lng) or not isfinite(count):
+            bad_rows.append(idx)
+            continue
+        book_data.append({'lat': lat, 'lng': lng, 'count': int(count)})
+    
+    if bad_rows:
+        log(_skipped_rows_message('book', len(bad_rows), bad_rows[:5]))
+    return book_data
+
+
+def _place_rows(header: List[Any], body: List[List[Any]], kind: str, label: str,
+                id_col: str, lat_col: str, lng_col: str, name_col: str,
+                value_key: str, value_col: str,
+                log: Callable[[str], None] = print) -> List[Dict[str, Any]]:
+    """Parse volunteer or school records straight from a sheet's header and row lists."""
+    missing = [col for col in (lat_col, lng_col, name_col, value_col) if col not in header]
+    if missing:
+        log(f"Warning: Skipping {kind}, missing columns: {missing}")
+        return []
+    
+    id_idx = header.index(id_col) if id_col in header else None
+    lat_idx, lng_idx, name_idx, value_idx = (
+        header.index(col) for col in (lat_col, lng_col, name_col, value_col)
+    )
+    
+    names = _column_text([row[name_idx] for row in body])
+    places = []
+    bad_rows = []
+    for idx, row in enumerate(body):
+        place_id = _cell_float(row[id_idx]) if id_idx is not None else idx + 1
+        lat = _cell_float(row[lat_idx])
+        lng = _cell_float(row[lng_idx])
+        value = _cell_float(row[value_idx])
+        if not isfinite(place_id) or isnan(lat) or isnan(lng) or not isfinite(value):
+            bad_rows.append(idx)
+            continue
+        places.append({
+            'id': int(place_id),
+            'lat': lat,
+            'lng': lng,
+            'name': names[idx],
+            value_key: int(value)
+        })
+    
+    if bad_rows:
+        log(_skipped_rows_message(label, len(bad_rows), bad_rows[:5]))
+    return places
+
+
+def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a typed frame into a list of plain-Python record dicts."""
+    columns = list(frame.columns)
+    return [dict(zip(columns, row))
+            for row in zip(*(frame[col].tolist() for col in columns))]
 
 
 def parse_book_data(df: pd.DataFrame, 
@@ -27,20 +286,7 @@ def parse_book_data(df: pd.DataFrame,
     Returns:
         List of book data dictionaries
     """
-    book_data = []
-    
-    for _, row in df.iterrows():
-        try:
-            book_data.append({
-                'lat': float(row[lat_col]),
-                'lng': float(row[lng_col]),
-                'count': int(row[count_col])
-            })
-        except (ValueError, KeyError) as e:
-            print(f"Warning: Skipping row due to error: {e}")
-            continue
-    
-    return book_data
+    return _records(_book_frame(df, lat_col, lng_col, count_col))
 
 
 def parse_volunteers(df: pd.DataFrame,
@@ -63,23 +309,8 @@ def parse_volunteers(df: pd.DataFrame,
     Returns:
         List of volunteer data dictionaries
     """
-    volunteers = []
-    
-    for idx, row in df.iterrows():
-        try:
-            volunteer_id = int(row[id_col]) if id_col in row else idx + 1
-            volunteers.append({
-                'id': volunteer_id,
-                'lat': float(row[lat_col]),
-                'lng': float(row[lng_col]),
-                'name': str(row[name_col]),
-                'books': int(row[books_col])
-            })
-        except (ValueError, KeyError) as e:
-            print(f"Warning: Skipping volunteer row due to error: {e}")
-            continue
-    
-    return volunteers
+    return _records(_place_frame(df, 'volunteers', 'volunteer',
+                                 id_col, lat_col, lng_col, name_col, 'books', books_col))
 
 
 def parse_schools(df: pd.DataFrame,
@@ -102,23 +333,8 @@ def parse_schools(df: pd.DataFrame,
     Returns:
         List of school data dictionaries
     """
-    schools = []
-    
-    for idx, row in df.iterrows():
-        try:
-            school_id = int(row[id_col]) if id_col in row else idx + 1
-            schools.append({
-                'id': school_id,
-                'lat': float(row[lat_col]),
-                'lng': float(row[lng_col]),
-                'name': str(row[name_col]),
-                'students': int(row[students_col])
-            })
-        except (ValueError, KeyError) as e:
-            print(f"Warning: Skipping school row due to error: {e}")
-            continue
-    
-    return schools
+    return _records(_place_frame(df, 'schools', 'school',
+                                 id_col, lat_col, lng_col, name_col, 'students', students_col))
 
 
 def auto_detect_columns(df: pd.DataFrame, data_type: str) -> Dict[str, str]:
@@ -132,86 +348,140 @@ def auto_detect_columns(df: pd.DataFrame, data_type: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping standard names to detected column names
     """
-    columns_lower = {col.lower(): col for col in df.columns}
-    mapping = {}
-    
+    return _detect_columns(df.columns, data_type)
+
+
+def _detect_columns(columns: List[Any], data_type: str) -> Dict[str, str]:
+    """Match header names against the data type's patterns, case-insensitively."""
+    # Copy so callers can edit the mapping without touching the cached one
+    return dict(_detect_columns_cached(tuple(columns), data_type))
+
+
+@lru_cache(maxsize=128)
+def _detect_columns_cached(columns: Tuple[Any, ...], data_type: str) -> Dict[str, str]:
+    """Memoized pattern match, keyed on the header layout and data type."""
+    columns_lower = {str(col).lower(): col for col in columns}
+    mapping = {
+        std: next((columns_lower[p] for p in patterns if p in columns_lower), None)
+        for std, patterns in _PATTERNS.get(data_type, {}).items()
+    }
+    return {std: col for std, col in mapping.items() if col is not None}
+
+
+def _resolve_columns(data_type: str, mapping: Dict[str, str]) -> Dict[str, str]:
+    """Resolve a column mapping into keyword arguments for the frame builders."""
     if data_type == 'books':
-        # Try to find latitude column
-        for pattern in ['lat', 'latitude', 'y', 'coord_y']:
-            if pattern in columns_lower:
-                mapping['lat'] = columns_lower[pattern]
-                break
-        
-        # Try to find longitude column
-        for pattern in ['lng', 'lon', 'long', 'longitude', 'x', 'coord_x']:
-            if pattern in columns_lower:
-                mapping['lng'] = columns_lower[pattern]
-                break
-        
-        # Try to find count column
-        for pattern in ['count', 'books', 'book_count', 'quantity', 'num']:
-            if pattern in columns_lower:
-                mapping['count'] = columns_lower[pattern]
-                break
-    
-    elif data_type == 'volunteers':
-        for pattern in ['id', 'volunteer_id', 'vol_id']:
-            if pattern in columns_lower:
-                mapping['id'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['lat', 'latitude', 'y']:
-            if pattern in columns_lower:
-                mapping['lat'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['lng', 'lon', 'long', 'longitude', 'x']:
-            if pattern in columns_lower:
-                mapping['lng'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['name', 'volunteer_name', 'vol_name', 'full_name']:
-            if pattern in columns_lower:
-                mapping['name'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['books', 'book_count', 'books_distributed']:
-            if pattern in columns_lower:
-                mapping['books'] = columns_lower[pattern]
-                break
-    
-    elif data_type == 'schools':
-        for pattern in ['id', 'school_id']:
-            if pattern in columns_lower:
-                mapping['id'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['lat', 'latitude', 'y']:
-            if pattern in columns_lower:
-                mapping['lat'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['lng', 'lon', 'long', 'longitude', 'x']:
-            if pattern in columns_lower:
-                mapping['lng'] = columns_lower[pattern]
-                break
-        
-        for pattern in ['name', 'school_name', 'school']:
-            if pattern in columns_lower:
-                mapping['name'] = columns_lower[pattern]
-                break
+        return {
+            'lat_col': mapping.get('lat', 'lat'),
+            'lng_col': mapping.get('lng', 'lng'),
+            'count_col': mapping.get('count', 'count')
+        }
+    value_key = 'books' if data_type == 'volunteers' else 'students'
+    return {
+        'id_col': mapping.get('id', 'id'),
+        'lat_col': mapping.get('lat', 'lat'),
+        'lng_col': mapping.get('lng', 'lng'),
+        'name_col': mapping.get('name', 'name'),
+        'value_col': mapping.get(value_key, value_key)
+    }
+
+
+def _select_sheets(sheet_names: Dict[str, Optional[str]],
+                   available_sheets: List[str]) -> List[Tuple[str, str]]:
+    """Resolve the sheet to parse for each requested data type."""
+    # Fall back to the first, second and third sheet respectively
+    jobs = []
+    for position, data_type in enumerate(('books', 'volunteers', 'schools')):
+        if data_type in sheet_names:
+            default = available_sheets[position] if len(available_sheets) > position else available_sheets[0]
+            sheet_name = sheet_names[data_type] or default
+            if sheet_name in available_sheets:
+                jobs.append((data_type, sheet_name))
+    return jobs
+
+
+def _sheet_preamble(data_type: str, sheet_name: str, header: List[Any],
+                    column_mappings: Dict[str, Dict[str, str]]) -> List[str]:
+    """Auto-detect missing column mappings and return the sheet's opening log lines."""
+    lines = [f"\nParsing {data_type} from sheet: {sheet_name}",
+             f"Columns: {', '.join(map(str, header))}"]
+    
+    # Auto-detect columns if not provided
+    if data_type not in column_mappings:
+        detected = _detect_columns(header, data_type)
+        column_mappings[data_type] = detected
+        lines.append(f"Auto-detected columns: {detected}")
+    
+    return lines
+
+
+def _parse_small_workbook(workbook, sheet_names: Dict[str, Optional[str]],
+                          column_mappings: Dict[str, Dict[str, str]],
+                          result: Dict[str, Any]):
+    """Parse a small workbook from calamine's row lists, without pandas."""
+    available_sheets = workbook.sheet_names
+    print(f"Available sheets: {', '.join(available_sheets)}")
+    
+    rows = {}
+    for data_type, sheet_name in _select_sheets(sheet_names, available_sheets):
+        if sheet_name not in rows:
+            rows[sheet_name] = workbook.get_sheet_by_name(sheet_name).to_python()
+        header, body = (rows[sheet_name][0], rows[sheet_name][1:]) if rows[sheet_name] else ([], [])
         
-        for pattern in ['students', 'student_count', 'num_students']:
-            if pattern in columns_lower:
-                mapping['students'] = columns_lower[pattern]
-                break
+        lines = _sheet_preamble(data_type, sheet_name, header, column_mappings)
+        columns = _resolve_columns(data_type, column_mappings[data_type])
+        if data_type == 'books':
+            section = _book_rows(header, body, log=lines.append, **columns)
+            lines.append(f"Parsed {len(section)} book data points")
+            result['bookData'] = section
+        else:
+            value_key = 'books' if data_type == 'volunteers' else 'students'
+            section = _place_rows(header, body, data_type, data_type[:-1], value_key=value_key,
+                                  log=lines.append, **columns)
+            lines.append(f"Parsed {len(section)} {data_type}")
+            result[data_type] = section
+        print('\n'.join(lines))
+
+
+def _open_small_workbook(file_path: Path):
+    """Open the workbook with python-calamine if it is small enough to skip pandas."""
+    if file_path.stat().st_size >= _SMALL_WORKBOOK_BYTES:
+        return None
+    try:
+        from python_calamine import CalamineError, CalamineWorkbook
+    except ImportError:
+        return None
+    try:
+        return CalamineWorkbook.from_path(str(file_path))
+    except CalamineError:
+        # Leave formats calamine cannot read to pandas' default engine
+        return None
+
+
+def _parse_sheet(data_type: str, df: pd.DataFrame, columns: Dict[str, str],
+                 lines: List[str], as_frames: bool) -> Any:
+    """
+    Parse one loaded sheet, appending its log messages to lines.
     
-    return mapping
+    Returns:
+        Parsed section, as a typed DataFrame or a list of dictionaries
+    """
+    if data_type == 'books':
+        frame = _book_frame(df, log=lines.append, **columns)
+        lines.append(f"Parsed {len(frame)} book data points")
+    else:
+        value_key = 'books' if data_type == 'volunteers' else 'students'
+        frame = _place_frame(df, data_type, data_type[:-1], value_key=value_key,
+                             log=lines.append, **columns)
+        lines.append(f"Parsed {len(frame)} {data_type}")
+    
+    return frame if as_frames else _records(frame)
 
 
 def parse_excel_file(file_path: str, 
                      sheet_names: Optional[Dict[str, str]] = None,
-                     column_mappings: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Any]:
+                     column_mappings: Optional[Dict[str, Dict[str, str]]] = None,
+                     as_frames: bool = False) -> Dict[str, Any]:
     """
     Parse Excel file and extract book data, volunteers, and schools.
     
@@ -221,6 +491,9 @@ def parse_excel_file(file_path: str,
                     e.g., {'books': 'Sheet1', 'volunteers': 'Sheet2', 'schools': 'Sheet3'}
         column_mappings: Dictionary of column mappings for each data type
                         e.g., {'books': {'lat': 'Latitude', 'lng': 'Longitude'}}
+        as_frames: Return each section as a typed DataFrame instead of a list
+                   of dictionaries, so exporters can skip building the dicts.
+                   Small workbooks parsed without pandas always return lists
     
     Returns:
         Dictionary containing parsed data
@@ -248,111 +521,96 @@ def parse_excel_file(file_path: str,
         'schools': []
     }
     
-    # Read Excel file
-    excel_file = pd.ExcelFile(file_path)
-    available_sheets = excel_file.sheet_names
+    workbook = _open_small_workbook(file_path)
+    if workbook is not None:
+        _parse_small_workbook(workbook, sheet_names, column_mappings, result)
+        return result
     
-    print(f"Available sheets: {', '.join(available_sheets)}")
+    import pandas as pd
     
-    # Parse books data
-    if 'books' in sheet_names:
-        sheet_name = sheet_names['books'] or available_sheets[0]
-        if sheet_name in available_sheets:
-            df_books = pd.read_excel(excel_file, sheet_name=sheet_name)
-            print(f"\nParsing books from sheet: {sheet_name}")
-            print(f"Columns: {', '.join(df_books.columns)}")
-            
-            # Auto-detect columns if not provided
-            if 'books' not in column_mappings:
-                detected = auto_detect_columns(df_books, 'books')
-                column_mappings['books'] = detected
-                print(f"Auto-detected columns: {detected}")
-            
-            mapping = column_mappings['books']
-            result['bookData'] = parse_book_data(
-                df_books,
-                lat_col=mapping.get('lat', 'lat'),
-                lng_col=mapping.get('lng', 'lng'),
-                count_col=mapping.get('count', 'count')
-            )
-            print(f"Parsed {len(result['bookData'])} book data points")
-    
-    # Parse volunteers data
-    if 'volunteers' in sheet_names:
-        sheet_name = sheet_names['volunteers'] or (available_sheets[1] if len(available_sheets) > 1 else available_sheets[0])
-        if sheet_name in available_sheets:
-            df_volunteers = pd.read_excel(excel_file, sheet_name=sheet_name)
-            print(f"\nParsing volunteers from sheet: {sheet_name}")
-            print(f"Columns: {', '.join(df_volunteers.columns)}")
-            
-            if 'volunteers' not in column_mappings:
-                detected = auto_detect_columns(df_volunteers, 'volunteers')
-                column_mappings['volunteers'] = detected
-                print(f"Auto-detected columns: {detected}")
-            
-            mapping = column_mappings['volunteers']
-            result['volunteers'] = parse_volunteers(
-                df_volunteers,
-                id_col=mapping.get('id', 'id'),
-                lat_col=mapping.get('lat', 'lat'),
-                lng_col=mapping.get('lng', 'lng'),
-                name_col=mapping.get('name', 'name'),
-                books_col=mapping.get('books', 'books')
-            )
-            print(f"Parsed {len(result['volunteers'])} volunteers")
-    
-    # Parse schools data
-    if 'schools' in sheet_names:
-        sheet_name = sheet_names['schools'] or (available_sheets[2] if len(available_sheets) > 2 else available_sheets[0])
-        if sheet_name in available_sheets:
-            df_schools = pd.read_excel(excel_file, sheet_name=sheet_name)
-            print(f"\nParsing schools from sheet: {sheet_name}")
-            print(f"Columns: {', '.join(df_schools.columns)}")
-            
-            if 'schools' not in column_mappings:
-                detected = auto_detect_columns(df_schools, 'schools')
-                column_mappings['schools'] = detected
-                print(f"Auto-detected columns: {detected}")
-            
-            mapping = column_mappings['schools']
-            result['schools'] = parse_schools(
-                df_schools,
-                id_col=mapping.get('id', 'id'),
-                lat_col=mapping.get('lat', 'lat'),
-                lng_col=mapping.get('lng', 'lng'),
-                name_col=mapping.get('name', 'name'),
-                students_col=mapping.get('students', 'students')
-            )
-            print(f"Parsed {len(result['schools'])} schools")
+    with _open_workbook(file_path) as excel_file:
+        available_sheets = excel_file.sheet_names
+        print(f"Available sheets: {', '.join(available_sheets)}")
+        jobs = _select_sheets(sheet_names, available_sheets)
+        
+        # Read every needed sheet in one call, once even if shared by data types.
+        # calamine decodes a whole sheet regardless of nrows/usecols, so the
+        # columns are detected on the loaded frames rather than a header probe
+        sheets_needed = list(dict.fromkeys(sheet_name for _, sheet_name in jobs))
+        sheets = pd.read_excel(excel_file, sheet_name=sheets_needed) if jobs else {}
+    
+    result_keys = {'books': 'bookData', 'volunteers': 'volunteers', 'schools': 'schools'}
+    for data_type, sheet_name in jobs:
+        lines = _sheet_preamble(data_type, sheet_name,
+                                list(sheets[sheet_name].columns), column_mappings)
+        columns = _resolve_columns(data_type, column_mappings[data_type])
+        section = _parse_sheet(data_type, sheets[sheet_name], columns, lines, as_frames)
+        result[result_keys[data_type]] = section
+        print('\n'.join(lines))
     
     return result
 
 
+# Rows per DataFrame slice encoded at once when streaming a section
+_STREAM_CHUNK_ROWS = 10_000
+
+
+def _stream_records(f: BinaryIO, records: Any) -> None:
+    """Write a section as a JSON array, one encoded record per line."""
+    if len(records) == 0:
+        f.write(b"[]")
+        return
+    
+    # A DataFrame can only exist if pandas has already been imported
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(records, pd.DataFrame):
+        # Materialize bounded slices of the typed frame at a time
+        chunks = (_records(records.iloc[start:start + _STREAM_CHUNK_ROWS])
+                  for start in range(0, len(records), _STREAM_CHUNK_ROWS))
+    else:
+        chunks = (records,)
+    
+    f.write(b"[\n")
+    first = True
+    for chunk in chunks:
+        for record in chunk:
+            f.write(b"  " if first else b",\n  ")
+            f.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY))
+            first = False
+    f.write(b"\n]")
+
+
 def export_to_json(data: Dict[str, Any], output_path: str):
     """Export parsed data to JSON file."""
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(b'{\n"bookData": ')
+        _stream_records(f, data['bookData'])
+        f.write(b',\n"volunteers": ')
+        _stream_records(f, data['volunteers'])
+        f.write(b',\n"schools": ')
+        _stream_records(f, data['schools'])
+        f.write(b'\n}\n')
     print(f"\nData exported to JSON: {output_path}")
 
 
 def export_to_typescript(data: Dict[str, Any], output_path: str):
     """Export parsed data to TypeScript format."""
-    with open(output_path, 'w') as f:
-        f.write("// Auto-generated from Excel file\n")
-        f.write("// Book Data\n")
-        f.write("export const bookData = ")
-        f.write(json.dumps(data['bookData'], indent=2))
-        f.write(";\n\n")
+    with open(output_path, 'wb') as f:
+        f.write(b"// Auto-generated from Excel file\n")
+        f.write(b"// Book Data\n")
+        f.write(b"export const bookData = ")
+        _stream_records(f, data['bookData'])
+        f.write(b";\n\n")
         
-        f.write("// Volunteers\n")
-        f.write("export const volunteers = ")
-        f.write(json.dumps(data['volunteers'], indent=2))
-        f.write(";\n\n")
+        f.write(b"// Volunteers\n")
+        f.write(b"export const volunteers = ")
+        _stream_records(f, data['volunteers'])
+        f.write(b";\n\n")
         
-        f.write("// Schools\n")
-        f.write("export const schools = ")
-        f.write(json.dumps(data['schools'], indent=2))
-        f.write(";\n")
+        f.write(b"// Schools\n")
+        f.write(b"export const schools = ")
+        _stream_records(f, data['schools'])
+        f.write(b";\n")
     
     print(f"\nData exported to TypeScript: {output_path}")
 
@@ -383,7 +641,8 @@ def main():
                 'books': None,  # Will use first sheet or specify name
                 'volunteers': None,
                 'schools': None
-            }
+            },
+            as_frames=True
         )
         
         # Export data
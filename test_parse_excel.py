@@ -0,0 +1,74 @@
+"""Tests for the calamine and pandas parsers and the JSON/TypeScript writers."""
+
+import json
+import re
+from datetime import datetime
+
+import pytest
+
+import parse_excel
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('openpyxl')
+python_calamine = pytest.importorskip('python_calamine')
+
+
+@pytest.mark.parametrize('names, expected', [
+    (['Sarah Jöhnson', 42, 'a/b', 'skipped', None], ['Sarah Jöhnson', '42', 'nan']),
+    ([42, None, 7, 8, 9], ['42.0', 'nan', '9.0']),
+    ([datetime(2020, 1, 2), datetime(2020, 1, 3, 5, 6), None, None, None],
+     ['2020-01-02 00:00:00', '2020-01-03 05:06:00', 'NaT']),
+])
+def test_place_rows_match_place_frame(tmp_path, names, expected):
+    path = tmp_path / 'volunteers.xlsx'
+    pd.DataFrame({
+        'id': [1, 2, 3, 'x', 5],
+        'lat': [36.1627123456789, 36.2, None, 36.4, 36.5],
+        'lng': [-86.1, -86.2, -86.3, -86.4, -86.5],
+        'name': names,
+        'books': [45, 3.0, 1, 2, 7],
+    }).to_excel(path, index=False)
+    columns = {'id_col': 'id', 'lat_col': 'lat', 'lng_col': 'lng',
+               'name_col': 'name', 'value_col': 'books'}
+
+    rows = python_calamine.CalamineWorkbook.from_path(str(path)).get_sheet_by_index(0).to_python()
+    from_rows = parse_excel._place_rows(rows[0], rows[1:], 'volunteers', 'volunteer',
+                                        value_key='books', log=lambda msg: None, **columns)
+
+    with parse_excel._open_workbook(path) as excel_file:
+        df = pd.read_excel(excel_file)
+    from_frame = parse_excel._records(parse_excel._place_frame(
+        df, 'volunteers', 'volunteer', value_key='books', log=lambda msg: None, **columns))
+
+    assert from_rows == from_frame
+    assert [record['name'] for record in from_rows] == expected
+
+
+def test_unrelated_duplicate_columns_are_ignored():
+    df = pd.DataFrame([[1.5, 2.5, 3, 4, 5]], columns=['lat', 'lng', 'count', 'x', 'x'])
+    assert parse_excel.parse_book_data(df) == [{'lat': 1.5, 'lng': 2.5, 'count': 3}]
+
+
+def test_exports_stream_every_section_kind(tmp_path):
+    book_frame = parse_excel._book_frame(
+        pd.DataFrame({'lat': [36.1627, 36.2], 'lng': [-86.7816, -86.8], 'count': [45, 3.0]}))
+    volunteers = [{'id': 1, 'lat': 36.1, 'lng': -86.1, 'name': 'Sarah Jöhnson / 李', 'books': 12}]
+    data = {'bookData': book_frame, 'volunteers': volunteers, 'schools': []}
+    expected = {
+        'bookData': [{'lat': 36.1627, 'lng': -86.7816, 'count': 45},
+                     {'lat': 36.2, 'lng': -86.8, 'count': 3}],
+        'volunteers': volunteers,
+        'schools': [],
+    }
+
+    json_path = tmp_path / 'data.json'
+    parse_excel.export_to_json(data, str(json_path))
+    with open(json_path, encoding='utf-8') as f:
+        assert json.load(f) == expected
+
+    ts_path = tmp_path / 'data.ts'
+    parse_excel.export_to_typescript(data, str(ts_path))
+    blocks = re.findall(r'^export const (\w+) = (.*?);$', ts_path.read_text(encoding='utf-8'),
+                        re.MULTILINE | re.DOTALL)
+    assert [name for name, _ in blocks] == ['bookData', 'volunteers', 'schools']
+    assert [json.loads(body) for _, body in blocks] == list(expected.values())